@@ -4,6 +4,8 @@ This module contains the `Article` class.
 
 from datetime import datetime
 
+from medium_api._schemas import ArticleResponsesResp
+
 class Article:
     """Article Class
     
@@ -120,6 +122,18 @@ class Article:
                                            save_info=False)
 
 
+    def _load_info(self, resp):
+        # Used by `Medium.fetch_articles` to fill in an already fetched response
+        self.__info = dict(resp)
+        self.save_info()
+
+    def _load_content(self, resp):
+        self.__content = str(resp['content'])
+
+    def _has_content(self):
+        # Lets `Medium.fetch_articles` skip articles whose content is already loaded
+        return self.__content is not None
+
     def save_content(self):
         """Saves the textual content of the article
 
@@ -175,8 +189,10 @@ class Article:
             list: Returns a list of `response_ids`.
         """
         if self.__response_ids is None:
-            resp, _ = self.__get_resp(f'/article/{self.article_id}/responses')
-            self.__response_ids = list(resp['responses'])
+            resp, _ = self.__get_resp(f'/article/{self.article_id}/responses', schema=ArticleResponsesResp)
+            if resp is None:
+                return []
+            self.__response_ids = resp.responses
         
         return self.__response_ids
 
@@ -0,0 +1,49 @@
+"""
+This module contains the `ResponseCache` class, a persistent cache of API responses.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+class ResponseCache:
+    """SQLite backed cache of raw API responses, keyed by endpoint
+
+    Every entry expires ``ttl`` seconds after it was written. The raw response
+    body is stored, so a cache hit is decoded exactly like a fresh response.
+
+    Note:
+        `ResponseCache` class is NOT intended to be used directly by importing.
+        See the `cache_path` argument of :obj:`medium_api.medium.Medium`.
+
+    """
+    def __init__(self, path, ttl=86400, clock=time.time):
+        path = os.path.expanduser(path)
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        self.ttl = ttl
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__conn:
+            self.__conn.execute('CREATE TABLE IF NOT EXISTS responses '
+                                '(endpoint TEXT PRIMARY KEY, data BLOB NOT NULL, expires_at REAL NOT NULL)')
+
+    def get(self, endpoint):
+        """Returns the cached response body for `endpoint`, `None` if missing or expired"""
+        with self.__lock:
+            row = self.__conn.execute('SELECT data, expires_at FROM responses WHERE endpoint = ?', 
+                                      (endpoint,)).fetchone()
+
+        if row is None or row[1] < self.__clock():
+            return None
+        return row[0]
+
+    def set(self, endpoint, data):
+        """Stores the response body for `endpoint`"""
+        with self.__lock, self.__conn:
+            self.__conn.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?)', 
+                                (endpoint, bytes(data), self.__clock() + self.ttl))
@@ -64,7 +64,7 @@ class LatestPosts:
         return self.__posts 
 
     def fetch_articles(self, content=False):
-        """To fetch all the latestposts articles information (multithreading)
+        """To fetch all the latestposts articles information (asyncio)
 
         Args:
             content (bool, optional): Set it to `True` if you want to fetch the 
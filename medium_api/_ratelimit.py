@@ -0,0 +1,61 @@
+"""
+This module contains the `RateLimiter` class shared by all the API calls.
+"""
+
+import time
+import asyncio
+import threading
+from collections import deque
+
+class RateLimiter:
+    """Sliding log rate limiter
+
+    Allows at most ``n`` calls in any ``p`` seconds long window. The start time
+    of the last ``n`` admitted calls is kept, and a new call is admitted only
+    once the oldest of them is ``p`` seconds old. Unlike a fixed window, a
+    weighted window counter or a token bucket with burst ``n``, this never lets
+    more than ``n`` calls through around a window boundary.
+
+    Note:
+        `RateLimiter` class is NOT intended to be used directly by importing.
+        See :obj:`medium_api.medium.Medium.set_rate_limit`.
+
+    """
+    def __init__(self, n, p, clock=time.monotonic):
+        self.n = n
+        self.p = p
+        self.__clock = clock
+        self.__calls = deque()
+        self.__lock = threading.Lock()
+
+    def try_acquire(self):
+        """Counts a call if it's allowed right now
+
+        Returns:
+            float: 0 if the call is allowed, else the number of seconds to wait
+            before trying again.
+        """
+        with self.__lock:
+            now = self.__clock()
+            while self.__calls and now - self.__calls[0] >= self.p:
+                self.__calls.popleft()
+
+            if len(self.__calls) < self.n:
+                self.__calls.append(now)
+                return 0.0
+
+            return max(self.__calls[0] + self.p - now, 1e-3)
+
+    def acquire(self):
+        """Blocks the calling thread until a call is allowed"""
+        delay = self.try_acquire()
+        while delay:
+            time.sleep(delay)
+            delay = self.try_acquire()
+
+    async def aacquire(self):
+        """Waits (without blocking the event loop) until a call is allowed"""
+        delay = self.try_acquire()
+        while delay:
+            await asyncio.sleep(delay)
+            delay = self.try_acquire()
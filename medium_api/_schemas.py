@@ -0,0 +1,39 @@
+"""
+This module contains the typed schemas used to decode API responses.
+"""
+
+from typing import List
+
+import msgspec
+
+class UserIdResp(msgspec.Struct):
+    """Response of ``/user/id_for/{username}``"""
+    id: str
+
+class PubIdResp(msgspec.Struct):
+    """Response of ``/publication/id_for/{publication_slug}``"""
+    publication_id: str
+
+class RelatedTagsResp(msgspec.Struct):
+    """Response of ``/related_tags/{tag}``"""
+    related_tags: List[str]
+
+class UserArticlesResp(msgspec.Struct):
+    """Response of ``/user/{user_id}/articles``"""
+    associated_articles: List[str]
+
+class UserTopArticlesResp(msgspec.Struct):
+    """Response of ``/user/{user_id}/top_articles``"""
+    top_articles: List[str]
+
+class ArticleResponsesResp(msgspec.Struct):
+    """Response of ``/article/{article_id}/responses``"""
+    responses: List[str]
+
+class TopFeedsResp(msgspec.Struct):
+    """Response of ``/topfeeds/{tag}/{mode}``"""
+    topfeeds: List[str]
+
+class TopWritersResp(msgspec.Struct):
+    """Response of ``/top_writers/{topic_slug}``"""
+    top_writers: List[str]
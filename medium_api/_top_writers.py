@@ -2,6 +2,8 @@
 top_writers module
 """
 
+from medium_api._schemas import TopWritersResp
+
 class TopWriters:
     """TopWriters Class
     
@@ -35,8 +37,10 @@ class TopWriters:
         
         """
         if self.__ids is None:
-            resp, _ = self.__get_resp(f'/top_writers/{self.topic_slug}')
-            self.__ids = list(resp['top_writers'])
+            resp, _ = self.__get_resp(f'/top_writers/{self.topic_slug}', schema=TopWritersResp)
+            if resp is None:
+                return []
+            self.__ids = resp.top_writers
 
         return self.__ids
 
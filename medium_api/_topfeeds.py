@@ -2,6 +2,8 @@
 topfeeds module containing `TopFeeds` class.
 """
 
+from medium_api._schemas import TopFeedsResp
+
 class TopFeeds:
     """TopFeeds Class
     
@@ -36,8 +38,10 @@ class TopFeeds:
         
         """
         if self.__ids is None:
-            resp, _ = self.__get_resp(f'/topfeeds/{self.tag}/{self.mode}')
-            self.__ids = list(resp['topfeeds'])
+            resp, _ = self.__get_resp(f'/topfeeds/{self.tag}/{self.mode}', schema=TopFeedsResp)
+            if resp is None:
+                return []
+            self.__ids = resp.topfeeds
 
         return self.__ids
 
@@ -63,7 +67,7 @@ class TopFeeds:
         return self.__articles
 
     def fetch_articles(self, content=False):
-        """To fetch all the topfeeds articles information (multithreading)
+        """To fetch all the topfeeds articles information (asyncio)
 
         Args:
             content (bool, optional): Set it to `True` if you want to fetch the 
@@ -3,6 +3,8 @@ Users Module
 '''
 from datetime import datetime
 
+from medium_api._schemas import UserArticlesResp, UserTopArticlesResp
+
 class User:
     """User Class
     
@@ -97,8 +99,10 @@ class User:
         
         """
         if self.__article_ids is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}/articles')
-            self.__article_ids = list(resp['associated_articles'])
+            resp, _ = self.__get_resp(f'/user/{self._id}/articles', schema=UserArticlesResp)
+            if resp is None:
+                return []
+            self.__article_ids = resp.associated_articles
 
         return self.__article_ids
 
@@ -112,8 +116,10 @@ class User:
         
         """
         if self.__top_article_ids is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}/top_articles')
-            self.__top_article_ids = list(resp['top_articles'])
+            resp, _ = self.__get_resp(f'/user/{self._id}/top_articles', schema=UserTopArticlesResp)
+            if resp is None:
+                return []
+            self.__top_article_ids = resp.top_articles
 
         return self.__top_article_ids
 
@@ -311,6 +317,11 @@ class User:
             print(f"[ERROR]: Could not retrieve {e} for the given user_id ({self.user_id}). Please check if this user exists.")
             print(f"[ERROR]: Link to unknown user's profile: https://medium.com/u/{self.user_id}")
 
+    def _load_info(self, resp):
+        # Used by `Medium.fetch_users` to fill in an already fetched response
+        self.__info = dict(resp)
+        self.save_info()
+
     def fetch_articles(self, content=False):
         """To fetch all the user-written articles information and content
 
@@ -6,22 +6,88 @@ different functions provided in it.
 
 import time
 import re
+import random
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-from http.client import HTTPSConnection
-from ujson import loads
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.client import HTTPSConnection, HTTPException
+import msgspec
+import aiohttp
 
-from medium_api._topfeeds import TopFeeds
 from medium_api._user import User
 from medium_api._article import Article
 from medium_api._publication import Publication
-from medium_api._top_writers import TopWriters
 from medium_api._latestposts import LatestPosts
-from async_mixin.mixin import AsyncHttpMixin
+from medium_api._ratelimit import RateLimiter
+from medium_api._cache import ResponseCache
+from medium_api._schemas import UserIdResp, PubIdResp, RelatedTagsResp
 from typing import Union, List
 import asyncio
 
-class MediumClient(AsyncHttpMixin):
+_URL_RE = re.compile(r'https?://\S+')
+# Last hyphen or slash separated alphanumeric chunk of the URL path
+_ID_RE = re.compile(r'[/-]([^\W_]+)$')
+# Endpoints returning (nearly) static data, safe to serve from the disk cache
+_CACHEABLE_ENDPOINTS = ('/user/id_for/', '/publication/id_for/', '/related_tags/')
+
+
+@lru_cache(maxsize=None)
+def _decoder(schema=None):
+    # Decoders are built once per schema and reused by every response
+    if schema is None:
+        return msgspec.json.Decoder()
+    return msgspec.json.Decoder(schema)
+
+
+def _decode(data:bytes, schema=None):
+    # Typed decoding skips building a dict for fields we never read. Error
+    # payloads don't match the schema, so those are decoded generically.
+    # The raw response buffer is decoded in place, without a `str` copy.
+    if schema is not None:
+        try:
+            return _decoder(schema).decode(data)
+        except msgspec.ValidationError:
+            pass
+    return _decoder().decode(data)
+
+
+def _run(coro):
+    # `asyncio.run` refuses to nest: inside a running event loop (Jupyter,
+    # async apps) the coroutine gets its own loop on a worker thread instead
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _failure(schema=None):
+    # Failed calls return `None` when a schema was asked for, so typed callers
+    # can check for it instead of getting an AttributeError on `{}`
+    return None if schema is not None else {}
+
+
+async def _gather_all(tasks):
+    # Like the thread pool it replaces, lets every task finish before raising
+    # the first failure, so one bad item doesn't cancel the rest of the batch
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _backoff(retries:int):
+    # Capped exponential backoff with jitter, so that concurrent retries
+    # don't all hit the API again at the same moment
+    return min(8, 0.5 * (2 ** retries)) + random.random() * 0.25
+
+
+class MediumClient:
     """Main Medium API Class to access everything
 
         Typical usage example:
@@ -48,6 +114,20 @@ class MediumClient(AsyncHttpMixin):
 
             ``print(medium.calls)``
 
+        n (int, optional): Maximum number of API calls allowed in every `p` seconds.
+            (Default is 100)
+
+        p (int, optional): Length of the rate limiting period in seconds. (Default
+            is 60)
+
+        cache_path (str, optional): Path of a SQLite file used to cache the responses
+            of near-static endpoints (usernames and publication slugs to ids, related
+            tags) across runs, e.g. ``~/.medium_api_cache``. (Default is `None`, no
+            caching)
+
+        cache_ttl (int, optional): Number of seconds a cached response stays valid.
+            (Default is 86400, one day)
+
     Returns:
         Medium: A `Medium` Class Object for the given *RAPIDAPI_KEY*. It can be
         used to access all the other functions such as: `user`, `article`, 
@@ -63,44 +143,314 @@ class MediumClient(AsyncHttpMixin):
                  calls:int=0,
                  n: int = 100,
                  p: int = 60,
+                 cache_path: str = None,
+                 cache_ttl: int = 86400,
                  ):
-        super(MediumClient, self).__init__()
         self.headers = {
             'X-RapidAPI-Key': rapidapi_key,
             "X-RapidAPI-Host": "medium2.p.rapidapi.com",
             'User-Agent': f"medium-api-python-sdk"
         }
+        self.calls = calls
         self.set_rate_limit(n=n, p=p)
         self.call_count_limit_key = 'X-RateLimit-All-endpoints-Limit'
         self.call_limit_remaining_key = 'X-RateLimit-All-endpoints-Remaining'
         self.call_count_limit = None
         self.remaining_calls = None
+        self.__local = threading.local()
+        self.__in_flight = 0
+        self.__probe = True
+        self.__quota_lock = threading.Lock()
+        self.__user_ids = OrderedDict()
+        self.__cache = ResponseCache(cache_path, ttl=cache_ttl) if cache_path is not None else None
+
+    def __cache_get(self, endpoint:str):
+        if self.__cache is not None and endpoint.startswith(_CACHEABLE_ENDPOINTS):
+            return self.__cache.get(endpoint)
+        return None
 
-    def __get_resp(self, endpoint:str, retries:int=0):
-        conn = HTTPSConnection(self.base_url)
-        conn.request('GET', endpoint, headers=self.headers)
-        resp = conn.getresponse()
+    def __cache_set(self, endpoint:str, data:bytes):
+        if self.__cache is not None and endpoint.startswith(_CACHEABLE_ENDPOINTS):
+            self.__cache.set(endpoint, data)
+
+    async def __acache_get(self, endpoint:str):
+        # sqlite blocks, so the async path reads the cache from a worker thread
+        if self.__cache is not None and endpoint.startswith(_CACHEABLE_ENDPOINTS):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.__cache.get, endpoint)
+        return None
+
+    async def __acache_set(self, endpoint:str, data:bytes):
+        if self.__cache is not None and endpoint.startswith(_CACHEABLE_ENDPOINTS):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.__cache.set, endpoint, data)
+
+    def __cache_user_id(self, username:str, user_id:str):
+        # LRU cache of resolved usernames, so repeated lookups don't use up quota
+        self.__user_ids[username] = user_id
+        self.__user_ids.move_to_end(username)
+        if len(self.__user_ids) > 4096:
+            self.__user_ids.popitem(last=False)
+
+    def __user_id(self, username:str):
+        username = str(username)
+        if username not in self.__user_ids:
+            resp, _ = self.__get_resp(f'/user/id_for/{username}', schema=UserIdResp)
+            if resp is None:
+                return None
+            self.__cache_user_id(username, resp.id)
+        else:
+            self.__user_ids.move_to_end(username)
+
+        return self.__user_ids[username]
+
+    def set_rate_limit(self, n:int, p:int):
+        """To throttle the API calls to at most `n` calls per `p` seconds
+
+            Typical usage example:
+
+            ``medium.set_rate_limit(n=100, p=60)``
+
+        Args:
+            n (int): Maximum number of API calls (and burst size).
+
+            p (int): Length of the period in seconds.
+
+        Returns:
+            None
+
+        """
+        self.__limiter = RateLimiter(n=n, p=p)
+
+    def __connection(self):
+        # One keep-alive connection per thread: `HTTPSConnection` is not
+        # thread-safe, but reusing it skips the TCP + TLS handshake per call.
+        conn = getattr(self.__local, 'conn', None)
+        if conn is None:
+            conn = HTTPSConnection(self.base_url)
+            self.__local.conn = conn
+        return conn
+
+    def __request(self, endpoint:str):
+        self.__limiter.acquire()
+        conn = self.__connection()
+        try:
+            conn.request('GET', endpoint, headers=self.headers)
+            resp = conn.getresponse()
+            data = resp.read()
+        except (HTTPException, OSError):
+            # The server may drop an idle keep-alive socket, reconnect once
+            conn.close()
+            conn.request('GET', endpoint, headers=self.headers)
+            resp = conn.getresponse()
+            data = resp.read()
+
+        return data, resp.status, resp.headers
+
+    def __update_quota(self, headers):
+        # RapidAPI reports the plan's quota on every response
+        limit = headers.get(self.call_count_limit_key)
+        remaining = headers.get(self.call_limit_remaining_key)
+        if limit is not None and limit.isdigit():
+            self.call_count_limit = int(limit)
+        if remaining is not None and remaining.isdigit():
+            self.remaining_calls = int(remaining)
+
+    def __allow_probe(self):
+        # Every batch (or single sync call) may send one call past an exhausted
+        # quota: `remaining_calls` is only refreshed by a response, so without
+        # it a reported 0 would refuse every later call, even after a reset.
+        with self.__quota_lock:
+            self.__probe = True
+
+    def __reserve_call(self):
+        # Counts a call against the quota left. `remaining_calls` only covers
+        # the calls that already got a response, so the calls still in flight
+        # are taken off it; once nothing is left the call is refused, except
+        # for the probe, which goes out alone.
+        with self.__quota_lock:
+            if self.remaining_calls is not None and self.remaining_calls - self.__in_flight <= 0:
+                if self.__in_flight or not self.__probe:
+                    return False
+                self.__probe = False
+            self.__in_flight += 1
+            return True
+
+    def __release_call(self, headers=None):
+        with self.__quota_lock:
+            if headers is not None:
+                self.__update_quota(headers)
+            self.__in_flight -= 1
+
+    def __concurrency(self):
+        # Sizes the semaphore of a batch: at most `n` calls (the rate limit) in
+        # parallel, fewer once the quota is running out. This only bounds the
+        # parallelism, the total is capped per call by `__reserve_call`
+        concurrency = self.__limiter.n
+        if self.remaining_calls is not None:
+            concurrency = min(concurrency, self.remaining_calls)
+        return max(1, concurrency)
+
+    def __get_resp(self, endpoint:str, retries:int=0, schema=None):
+        cached = self.__cache_get(endpoint)
+        if cached is not None:
+            return _decode(cached, schema), 200
+
+        if retries == 0:
+            self.__allow_probe()
+        if not self.__reserve_call():
+            print(f'[ERROR]: API quota exhausted ({self.remaining_calls} calls remaining), skipped: {endpoint}')
+            return _failure(schema), None
+
+        headers = None
+        try:
+            data, status, headers = self.__request(endpoint)
+        finally:
+            self.__release_call(headers)
 
-        data = resp.read()
-        status = resp.status
-        
         if status == 200:
             self.calls += 1
-            json_data = loads(data)
+            json_data = _decode(data, schema)
 
-            if not 'error' in json_data.keys():
+            if isinstance(json_data, msgspec.Struct) or (schema is None and 'error' not in json_data):
+                self.__cache_set(endpoint, data)
                 return json_data, status
             else:
-                if retries < 3:
-                    time.sleep(5)
-                    return self.__get_resp(endpoint=endpoint, retries=retries+1)
+                # Only API errors are retried, an unexpected shape won't change
+                if 'error' in json_data and retries < 3:
+                    time.sleep(_backoff(retries))
+                    return self.__get_resp(endpoint=endpoint, retries=retries+1, schema=schema)
                 else:
                     print(f'[ERROR]: Response: {json_data}')
-                    return {}, status
+                    return _failure(schema), status
         else:
             print(f'[ERROR]: Status Code: {status}')
             print(f'[ERROR]: Response: {data}')
-            return {}, status
+            return _failure(schema), status
+
+    def __client_session(self, limit:int = 100):
+        # One pooled session per batch: keep-alive connections and cached DNS
+        # lookups are shared by all the coroutines of the batch
+        connector = aiohttp.TCPConnector(limit=limit, ttl_dns_cache=600)
+        return aiohttp.ClientSession(headers=self.headers, connector=connector)
+
+    async def __aget_resp(self, session, url:str, retries:int=0, schema=None):
+        endpoint = url.partition(self.base_url)[2]
+        cached = await self.__acache_get(endpoint)
+        if cached is not None:
+            return _decode(cached, schema), 200
+
+        if not self.__reserve_call():
+            print(f'[ERROR]: API quota exhausted ({self.remaining_calls} calls remaining), skipped: {url}')
+            return _failure(schema), None
+
+        headers = None
+        try:
+            await self.__limiter.aacquire()
+            async with session.get(url) as resp:
+                data = await resp.read()
+                status = resp.status
+                headers = resp.headers
+        finally:
+            self.__release_call(headers)
+
+        if status == 200:
+            self.calls += 1
+            json_data = _decode(data, schema)
+
+            if isinstance(json_data, msgspec.Struct) or (schema is None and 'error' not in json_data):
+                await self.__acache_set(endpoint, data)
+                return json_data, status
+            else:
+                # Only API errors are retried, an unexpected shape won't change
+                if 'error' in json_data and retries < 3:
+                    await asyncio.sleep(_backoff(retries))
+                    return await self.__aget_resp(session, url=url, retries=retries+1, schema=schema)
+                else:
+                    print(f'[ERROR]: Response: {json_data}')
+                    return _failure(schema), status
+        else:
+            print(f'[ERROR]: Status Code: {status}')
+            print(f'[ERROR]: Response: {data}')
+            return _failure(schema), status
+
+    @staticmethod
+    def __needs_fetch(article, content:bool = False):
+        return article.title is None or (content and not article._has_content())
+
+    async def __aload_article(self, session, semaphore, articles:list, content:bool = False):
+        # `articles` are Article objects sharing the same article_id. Info and
+        # content are fetched back to back by the same coroutine, so the second
+        # call reuses the connection the first one just released to the pool
+        article_id = articles[0].article_id
+        async with semaphore:
+            pending = [article for article in articles if article.title is None]
+            if pending:
+                resp, _ = await self.__aget_resp(session, f'https://{self.base_url}/article/{article_id}')
+                # A failed call (already reported) leaves the articles unloaded
+                if not resp:
+                    return
+                for article in pending:
+                    article._load_info(resp)
+            pending = [article for article in articles if content and not article._has_content()]
+            if pending:
+                resp, _ = await self.__aget_resp(session, f'https://{self.base_url}/article/{article_id}/content')
+                if not resp:
+                    return
+                for article in pending:
+                    article._load_content(resp)
+
+    async def __asave_user_info(self, session, semaphore, users:list):
+        # `users` are User objects sharing the same user_id
+        async with semaphore:
+            resp, _ = await self.__aget_resp(session, f'https://{self.base_url}/user/{users[0]._id}')
+        if not resp:
+            return
+        for user in users:
+            user._load_info(resp)
+
+    async def __aguarded(self, semaphore, coro):
+        async with semaphore:
+            return await coro
+
+    async def __run_batch(self, urls:list, schema=None):
+        self.__allow_probe()
+        concurrency = self.__concurrency()
+        semaphore = asyncio.Semaphore(concurrency)
+        async with self.__client_session(limit=concurrency) as session:
+            results = await asyncio.gather(*[self.__aguarded(semaphore, self.__aget_resp(session, url, schema=schema)) 
+                                             for url in urls])
+
+        return [resp for resp, _ in results]
+
+    async def __afetch_articles(self, articles:list, content:bool = False):
+        self.__allow_probe()
+        concurrency = self.__concurrency()
+        semaphore = asyncio.Semaphore(concurrency)
+        async with self.__client_session(limit=concurrency) as session:
+            # One request per distinct article_id, duplicates share the response
+            groups = {}
+            for article in articles:
+                if self.__needs_fetch(article, content=content):
+                    groups.setdefault(article.article_id, []).append(article)
+
+            tasks = [self.__aload_article(session, semaphore, group, content=content) for group in groups.values()]
+
+            await _gather_all(tasks)
+
+    async def __afetch_users(self, users:list):
+        self.__allow_probe()
+        concurrency = self.__concurrency()
+        semaphore = asyncio.Semaphore(concurrency)
+        async with self.__client_session(limit=concurrency) as session:
+            groups = {}
+            for user in users:
+                if user.fullname is None:
+                    groups.setdefault(user._id, []).append(user)
+
+            tasks = [self.__asave_user_info(session, semaphore, group) for group in groups.values()]
+
+            await _gather_all(tasks)
 
     def user(self, username:str = None, user_id:str = None, save_info:bool = True):
         """For getting the Medium User Object
@@ -143,8 +493,10 @@ class MediumClient(AsyncHttpMixin):
                         fetch_users=self.fetch_users,
                         save_info = save_info)
         elif username is not None:
-            resp, _ = self.__get_resp(f'/user/id_for/{str(username)}')
-            user_id = resp['id']
+            user_id = self.__user_id(username)
+            if user_id is None:
+                print(f'[ERROR]: Could not find the user_id for the given username ({username})')
+                return None
             return User(user_id = user_id, 
                         get_resp = self.__get_resp, 
                         fetch_articles=self.fetch_articles,
@@ -198,8 +550,10 @@ class MediumClient(AsyncHttpMixin):
                         fetch_users=self.fetch_users,
                         save_info = save_info)
         elif username is not None:
-            resp, _ = self.__get_resp(f'/user/id_for/{str(username)}')
-            user_id = resp['id']
+            user_id = self.__user_id(username)
+            if user_id is None:
+                print(f'[ERROR]: Could not find the user_id for the given username ({username})')
+                return None
             return User(user_id = user_id, 
                         get_resp = self.__get_resp, 
                         fetch_articles=self.fetch_articles,
@@ -275,8 +629,11 @@ class MediumClient(AsyncHttpMixin):
                         save_info = save_info)
 
         elif publication_slug is not None:
-            resp, _ = self.__get_resp(f'/publication/id_for/{str(publication_slug)}')
-            publication_id = resp['publication_id']
+            resp, _ = self.__get_resp(f'/publication/id_for/{str(publication_slug)}', schema=PubIdResp)
+            if resp is None:
+                print(f'[ERROR]: Could not find the publication_id for the given publication_slug ({publication_slug})')
+                return None
+            publication_id = resp.publication_id
             return Publication(publication_id = publication_id, 
                         get_resp = self.__get_resp, 
                         fetch_articles=self.fetch_articles,
@@ -286,28 +643,6 @@ class MediumClient(AsyncHttpMixin):
             print('[ERROR]: Missing parameter: Please provide "publication_id" or "publication_slug" to call this function')
             return None
 
-    def top_writers(self, topic_slug:str):
-        """For getting the Medium's TopWriters Object
-
-            Typical usage example:
-
-            ``top_writers = medium.top_writers(topic_slug = "artificial-intelligence")``
-
-        Args:
-            topic_slug (str): It's a string (smallcase, hyphen-separated) which specifies
-                a category/niche as classified by the Medium Platform.
-
-        Returns:
-            TopWriters: Medium API `TopWriters` Object (medium_api.top_writers.TopWriters) 
-            that can be used to access all the properties and methods related to Medium's 
-            Top Writers for the give `topic_slug`.
-
-        """
-        return TopWriters(topic_slug=topic_slug, 
-                          get_resp=self.__get_resp, 
-                          fetch_users=self.fetch_users,
-                          fetch_articles=self.fetch_articles)
-
     def latestposts(self, topic_slug:str):
         """For getting the Medium's LatestPosts Object
 
@@ -331,59 +666,8 @@ class MediumClient(AsyncHttpMixin):
                            fetch_users=self.fetch_users,
                         )
 
-    def topfeeds(self, tag:str, mode:str):
-        """For getting the Medium's TopFeeds Object
-
-            Typical usage example:
-
-            ``topfeeds = medium.topfeeds(tag="blockchain", mode="new")``
-
-        Args:
-            tag (str): It's a string (smallcase, hyphen-separated) which specifies
-                a category/niche as classified by the Medium Platform.
-
-            mode (str): There are 6 modes as follows:
-
-                    - ``hot``: For getting trending articles
-                    - ``new``: For getting latest articles
-                    - ``top_year``: For getting best articles of the year
-                    - ``top_month``: For getting best articles of the month
-                    - ``top_week``: For getting best articles of the week
-                    - ``top_all_time``: For getting best article of all time
-
-
-        Returns:
-            TopFeeds: Medium API `TopFeeds` Object (medium_api.topfeeds.TopFeeds) 
-            that can be used to access all the properties and methods, for given `tag` 
-            and `mode`.
-
-        """
-        return TopFeeds(tag=tag, mode=mode, 
-                        get_resp=self.__get_resp, 
-                        fetch_articles=self.fetch_articles,
-                        fetch_users=self.fetch_users)
-
-    def related_tags(self, given_tag:str):
-        """For getting the list of related tags
-
-            Typical usage example:
-
-            ``related_tags = medium.related_tag(given_tag="blockchain")``
-
-        Args:
-            given_tag (str): It's a string (smallcase, hyphen-separated) which specifies
-                             a category/niche as classified by the Medium Platform.
-
-        Returns:
-            list[str]: List of Related Tags (strings).
-
-        """
-        resp, _ = self.__get_resp(f'/related_tags/{given_tag}')
-
-        return resp['related_tags']
-
     def fetch_articles(self, articles:list, content:bool = False):
-        """To quickly fetch articles (info and content) using multithreading
+        """To quickly fetch articles (info and content) concurrently using asyncio
 
             Typical usage example:
 
@@ -404,16 +688,12 @@ class MediumClient(AsyncHttpMixin):
             list of Article(s) objects itself.
 
         """
-        with ThreadPoolExecutor(max_workers=100) as executor:
-            future_to_url = [executor.submit(article.save_info) for article in articles if article.title is None]
-            if content:
-                future_to_url += [executor.submit(article.save_content) for article in articles]
-
-            for future in as_completed(future_to_url):
-                future.result()
+        # Nothing left to fetch, don't spin up an event loop and a session
+        if any(self.__needs_fetch(article, content=content) for article in articles):
+            _run(self.__afetch_articles(articles, content=content))
 
     def fetch_users(self, users:list):
-        """To quickly fetch users info using multithreading
+        """To quickly fetch users info concurrently using asyncio
 
             Typical usage example:
 
@@ -429,11 +709,8 @@ class MediumClient(AsyncHttpMixin):
             passed list of User(s) objects itself.
 
         """
-        with ThreadPoolExecutor(max_workers=100) as executor:
-            future_to_url = (executor.submit(user.save_info) for user in users if user.fullname is None)
-
-            for future in as_completed(future_to_url):
-                future.result()
+        if any(user.fullname is None for user in users):
+            _run(self.__afetch_users(users))
 
     def extract_article_id(self, article_url:str):
         """To get `article_id` from the Article's URL
@@ -450,28 +727,58 @@ class MediumClient(AsyncHttpMixin):
             str: Returns `article_id` as string for valid URL, else returns `None`.
 
         """
-        regex = r'(https?://[^\s]+)'
-        urls = re.findall(regex, article_url)
-
-        if urls:
-            urlpath = urlparse(urls[0]).path
-            if urlpath:
-                last_location = urlpath.split('/')[-1]
-                article_id = last_location.split('-')[-1]
+        url = _URL_RE.search(article_url)
 
-                if article_id.isalnum():
-                    return article_id
+        if url:
+            article_id = _ID_RE.search(urlparse(url.group()).path)
+            if article_id:
+                return article_id.group(1)
 
         return None
 
     # A Sink Below:
 
     def get_urls(self, endpoint, key, args):
-        return list(map(lambda x: 'https://' + self.base_url + x[0].format(**{key:x[1]}), 
-                        zip([endpoint]*len(args), args)))
+        # The template is split around its placeholder once, each URL is then
+        # a plain concatenation
+        prefix, _, suffix = endpoint.partition('{' + key + '}')
+        prefix = 'https://' + self.base_url + prefix
+        return [prefix + str(arg) + suffix for arg in args]
+
+    def __fetch(self, endpoint:str, key:str, args:list, schema=None):
+        # A single call doesn't need an event loop and a fresh session, it goes
+        # through the thread's keep-alive connection instead
+        if not args:
+            return []
+        if len(args) == 1:
+            resp, _ = self.__get_resp(endpoint.replace('{' + key + '}', str(args[0])), schema=schema)
+            return [resp]
+
+        urls = self.get_urls(endpoint=endpoint, key=key, args=args)
+        return _run(self.__run_batch(urls, schema=schema))
+
+    def __batch(self, endpoint:str, key:str, args, as_dict:bool = False, schema=None):
+        # Fetches `endpoint` for every (distinct) arg, returns (arg, response) pairs
+        if not isinstance(args, list):
+            args = [args]
+        unique = list(dict.fromkeys(args))
+
+        results = self.__fetch(endpoint=endpoint, key=key, args=unique, schema=schema)
+
+        return self.__pairs(args, unique, results, as_dict=as_dict)
+
+    @staticmethod
+    def __pairs(args:list, unique:list, results:list, as_dict:bool = False):
+        if as_dict:
+            return dict(zip(unique, results))
+        if len(unique) == len(args):
+            return list(zip(args, results))
+        # Duplicated args get the response of their first occurrence
+        by_arg = dict(zip(unique, results))
+        return [(arg, by_arg[arg]) for arg in args]
 
     #user ids
-    def users_id(self, username: Union[str,List[str]] = None):
+    def users_id(self, username: Union[str,List[str]] = None, as_dict: bool = False):
         """For getting the Medium User Object(s): Async retrieval when list of usernames or user_ids are passed
 
         Args:
@@ -482,93 +789,74 @@ class MediumClient(AsyncHttpMixin):
                 - ``username``.medium.com
                 - medium.com/@ ``username``
 
+            as_dict (bool, optional): If `True`, returns a dictionary keyed by username
+                instead of a list of pairs. (Default is `False`)
 
-        Returns: List of User ids
+
+        Returns: List of (username, user_id) pairs, in the order of `username`
 
         """
         if not isinstance(username, list):
             username = [username]
-
-        user_id_urls = self.get_urls(endpoint='/user/id_for/{username}', 
-                                 key='username', 
-                                 args=username)    
-        user_ids_res = self.pipeline(method=self.process_gets, 
-                                 args=user_id_urls)
-        if user_ids_res:
-            return dict(zip(username, user_ids_res))
-
-
-    # users' info
-    def users_info(self, username: Union[str,List[str]] = None, user_id: Union[str,List[str]] = None,):
+        username = [str(name) for name in username]
+        unique = list(dict.fromkeys(username))
+
+        # The results of this call are collected locally: the LRU only serves
+        # reuse across calls, and may evict entries of a large batch early
+        resolved = {name: self.__user_ids[name] for name in unique if name in self.__user_ids}
+
+        missing = [name for name in unique if name not in resolved]
+        if missing:
+            user_ids_res = self.__fetch(endpoint='/user/id_for/{username}', 
+                                        key='username', 
+                                        args=missing, 
+                                        schema=UserIdResp)
+            for name, resp in zip(missing, user_ids_res):
+                if isinstance(resp, UserIdResp):
+                    resolved[name] = resp.id
+                    self.__cache_user_id(name, resp.id)
+
+        user_ids = [resolved.get(name) for name in unique]
+        return self.__pairs(username, unique, user_ids, as_dict=as_dict)
+
+    def __resolve_user_ids(self, username, user_id):
         assert (username is not None) or (user_id is not None), 'You have to provide either `username` or `user_id`'\
                                                                 'to get the User object. You cannot omit both. '
         if user_id is None:
-            if not isinstance(username, list):
-                username = [username]
-            user_id = self.users_id(username=username)
-        else:
-            if not isinstance(user_id, list):
-                user_id = [user_id] 
+            return [uid for _, uid in self.users_id(username=username) if uid is not None]
+        return user_id
 
-        
-        user_info_urls = self.get_urls(endpoint='/user/{user_id}', 
-                                       key='user_id', 
-                                       args=user_id)    
-        user_info_res = self.pipeline(method=self.process_gets, 
-                                 args=user_info_urls)
-        if user_info_res:
-            return dict(zip(user_id, user_info_res))
+    # users' info
+    def users_info(self, username: Union[str,List[str]] = None, user_id: Union[str,List[str]] = None, as_dict: bool = False):
+        return self.__batch(endpoint='/user/{user_id}', 
+                            key='user_id', 
+                            args=self.__resolve_user_ids(username, user_id), 
+                            as_dict=as_dict)
 
     # users' following
     # users' followers 
     # users' articles
-    def user_articles(self, username: Union[str,List[str]] = None, user_id: Union[str,List[str]] = None,):
-        assert (username is not None) or (user_id is not None), 'You have to provide either `username` or `user_id`'\
-                                                                'to get the User object. You cannot omit both. '
-        if user_id is None:
-            if not isinstance(username, list):
-                username = [username]
-            user_id = self.users_id(username=username)
-        else:
-            if not isinstance(user_id, list):
-                user_id = [user_id] 
-
-        
-        user_article_urls = self.get_urls(endpoint='/user/{user_id}/articles', 
-                                       key='user_id', 
-                                       args=user_id)    
-        user_article_res = self.pipeline(method=self.process_gets, 
-                                         args=user_article_urls)
-        if user_article_res:
-            return dict(zip(user_id, user_article_res))
-
-
+    def user_articles(self, username: Union[str,List[str]] = None, user_id: Union[str,List[str]] = None, as_dict: bool = False):
+        return self.__batch(endpoint='/user/{user_id}/articles', 
+                            key='user_id', 
+                            args=self.__resolve_user_ids(username, user_id), 
+                            as_dict=as_dict)
 
     # users' top articles
     # users' interests
     # articles' info
-    def article_info(self, article_id: Union[str,List[str]]):
-        if not isinstance(article_id, list):
-            article_id = [article_id]
-        article_info_urls = self.get_urls(endpoint='/article/{article_id}', 
-                                       key='article_id', 
-                                       args=article_id)    
-        article_info_res = self.pipeline(method=self.process_gets, 
-                                 args=article_info_urls)
-        if article_info_res:
-            return dict(zip(article_id, article_info_res))
+    def article_info(self, article_id: Union[str,List[str]], as_dict: bool = False):
+        return self.__batch(endpoint='/article/{article_id}', 
+                            key='article_id', 
+                            args=article_id, 
+                            as_dict=as_dict)
 
     # articles' content
-    def article_content(self, article_id: Union[str,List[str]]):
-        if not isinstance(article_id, list):
-            article_id = [article_id]
-        article_content_urls = self.get_urls(endpoint='/article/{article_id}/content', 
-                                       key='article_id', 
-                                       args=article_id)    
-        article_content_res = self.pipeline(method=self.process_gets, 
-                                 args=article_content_urls)
-        if article_content_res:
-            return dict(zip(article_id, article_content_res))
+    def article_content(self, article_id: Union[str,List[str]], as_dict: bool = False):
+        return self.__batch(endpoint='/article/{article_id}/content', 
+                            key='article_id', 
+                            args=article_id, 
+                            as_dict=as_dict)
         
     # articles' markdown
     # articles' responses
@@ -577,40 +865,46 @@ class MediumClient(AsyncHttpMixin):
     # publications' articles
     # publications' newsletters
     # topfeeds for tags and mode
-    def topfeeds(self, tag: Union[str,List[str]], mode: str = 'hot'):
-        if not isinstance(tag, list):
-            tag = [tag]
-        topfeeds_urls = self.get_urls(endpoint='/topfeeds/{tag}/' + mode, 
-                                       key='tag', 
-                                       args=tag)    
-        topfeeds_res = self.pipeline(method=self.process_gets, 
-                                     args=topfeeds_urls)
-        if topfeeds_res:
-            return dict(zip(tag, topfeeds_res))
+    def topfeeds(self, tag: Union[str,List[str]], mode: str = 'hot', as_dict: bool = False):
+        return self.__batch(endpoint='/topfeeds/{tag}/' + mode, 
+                            key='tag', 
+                            args=tag, 
+                            as_dict=as_dict)
 
     # top writers for topic_slug
-    def top_writers(self, topic_slug: Union[str,List[str]]):
-        if not isinstance(topic_slug, list):
-            topic_slug = [topic_slug]
-        top_writers_urls = self.get_urls(endpoint='top_writers/{topic_slug}', 
-                                         key='topic_slug', 
-                                         args=topic_slug)    
-        top_writers_res = self.pipeline(method=self.process_gets, 
-                                        args=top_writers_urls)
-        if top_writers_res:
-            return dict(zip(topic_slug, top_writers_res))
+    def top_writers(self, topic_slug: Union[str,List[str]], as_dict: bool = False):
+        return self.__batch(endpoint='/top_writers/{topic_slug}', 
+                            key='topic_slug', 
+                            args=topic_slug, 
+                            as_dict=as_dict)
 
     # latest posts
     # related tags
-    def related_tags(self, tag: Union[str,List[str]]):
+    def related_tags(self, tag: Union[str,List[str]], as_dict: bool = False):
+        """For getting the list(s) of related tags
+
+            Typical usage example:
+
+            ``related_tags = medium.related_tags(tag=["blockchain", "python"])``
+
+        Args:
+            tag (str | list[str]): Tag(s) (smallcase, hyphen-separated) as classified by 
+                the Medium Platform.
+
+            as_dict (bool, optional): If `True`, returns a dictionary keyed by tag
+                instead of a list of pairs. (Default is `False`)
+
+        Returns: List of (tag, related_tags) pairs, in the order of `tag`. `related_tags`
+            is `None` for the tags that couldn't be fetched.
+
+        """
         if not isinstance(tag, list):
             tag = [tag]
-        related_tags_urls = self.get_urls(endpoint='/related_tags/{tag}', 
-                                          key='tag', 
-                                          args=tag)    
-        related_tags_res = self.pipeline(method=self.process_gets, 
-                                         args=related_tags_urls)
-        if related_tags_res:
-            return dict(zip(tag, related_tags_res))
-
-              
\ No newline at end of file
+        unique = list(dict.fromkeys(tag))
+
+        related_tags_res = self.__fetch(endpoint='/related_tags/{tag}', 
+                                        key='tag', 
+                                        args=unique, 
+                                        schema=RelatedTagsResp)
+        related_tags = [resp.related_tags if resp is not None else None for resp in related_tags_res]
+        return self.__pairs(tag, unique, related_tags, as_dict=as_dict)
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+
+from medium_api import MediumClient
+from medium_api._cache import ResponseCache
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    clock.now = 1000.0
+    cache = ResponseCache(str(tmp_path / 'cache.db'), ttl=60, clock=clock)
+
+    cache.set('/related_tags/python', b'{"related_tags": []}')
+    assert cache.get('/related_tags/python') == b'{"related_tags": []}'
+
+    clock.now = 1060.0
+    assert cache.get('/related_tags/python') == b'{"related_tags": []}'
+
+    clock.now = 1060.5
+    assert cache.get('/related_tags/python') is None
+
+
+def test_missing_entry(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.db'))
+    assert cache.get('/user/id_for/nobody') is None
+
+
+def make_client(tmp_path, requests):
+    medium = MediumClient('KEY', cache_path=str(tmp_path / 'cache.db'))
+
+    def request(endpoint):
+        requests.append(endpoint)
+        return b'{"id": "abc", "related_tags": ["a"], "topfeeds": []}', 200, {}
+
+    medium._MediumClient__request = request
+    return medium
+
+
+def test_cacheable_endpoint_is_served_from_cache(tmp_path):
+    requests = []
+    medium = make_client(tmp_path, requests)
+    get_resp = medium._MediumClient__get_resp
+
+    first, _ = get_resp('/related_tags/python')
+    second, _ = get_resp('/related_tags/python')
+
+    assert first == second
+    assert requests == ['/related_tags/python']
+    assert medium.calls == 1
+
+
+def test_cache_persists_across_clients(tmp_path):
+    requests = []
+    make_client(tmp_path, requests)._MediumClient__get_resp('/user/id_for/nishu-jain')
+    make_client(tmp_path, requests)._MediumClient__get_resp('/user/id_for/nishu-jain')
+
+    assert requests == ['/user/id_for/nishu-jain']
+
+
+def test_other_endpoints_are_not_cached(tmp_path):
+    requests = []
+    get_resp = make_client(tmp_path, requests)._MediumClient__get_resp
+
+    get_resp('/topfeeds/python/hot')
+    get_resp('/topfeeds/python/hot')
+
+    assert requests == ['/topfeeds/python/hot', '/topfeeds/python/hot']
+
+
+class FakeSession:
+    class Response:
+        status = 200
+        headers = {}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def read(self):
+            return b'{"related_tags": ["a"]}'
+
+    def get(self, url):
+        return self.Response()
+
+
+def test_async_path_keeps_sqlite_off_the_event_loop(tmp_path):
+    medium = MediumClient('KEY', cache_path=str(tmp_path / 'cache.db'))
+    cache = medium._MediumClient__cache
+    threads = []
+
+    def record(method):
+        def wrapper(*args):
+            threads.append(threading.get_ident())
+            return method(*args)
+        return wrapper
+
+    cache.get = record(cache.get)
+    cache.set = record(cache.set)
+    aget_resp = medium._MediumClient__aget_resp
+    url = f'https://{medium.base_url}/related_tags/python'
+
+    async def main():
+        loop_thread = threading.get_ident()
+        first, _ = await aget_resp(FakeSession(), url)
+        second, _ = await aget_resp(FakeSession(), url)
+        return loop_thread, first, second
+
+    loop_thread, first, second = asyncio.run(main())
+
+    assert first == second == {'related_tags': ['a']}
+    assert medium.calls == 1
+    assert len(threads) == 3 and loop_thread not in threads
@@ -0,0 +1,225 @@
+import pytest
+
+from medium_api import MediumClient
+
+pairs = MediumClient._MediumClient__pairs
+
+
+def test_pairs_follow_input_order():
+    assert pairs(['a', 'b'], ['a', 'b'], [1, 2]) == [('a', 1), ('b', 2)]
+
+
+def test_pairs_broadcast_duplicates():
+    args = ['a', 'b', 'a', 'a']
+    unique = ['a', 'b']
+
+    assert pairs(args, unique, [1, 2]) == [('a', 1), ('b', 2), ('a', 1), ('a', 1)]
+
+
+def test_pairs_as_dict():
+    args = ['a', 'b', 'a']
+    unique = ['a', 'b']
+
+    assert pairs(args, unique, [1, 2], as_dict=True) == {'a': 1, 'b': 2}
+
+
+def fake_batch(medium, requests):
+    async def run_batch(urls, schema=None):
+        requests.extend(urls)
+        if schema is not None:
+            return [schema(id='id-' + url.rsplit('/', 1)[1]) for url in urls]
+        return [url.rsplit('/', 1)[1] for url in urls]
+
+    medium._MediumClient__run_batch = run_batch
+
+
+def test_batch_fetches_duplicates_once():
+    medium = MediumClient('KEY')
+    requests = []
+    fake_batch(medium, requests)
+
+    assert medium.article_info(['x', 'y', 'x']) == [('x', 'x'), ('y', 'y'), ('x', 'x')]
+    assert len(requests) == 2
+
+
+def test_users_id_reuses_resolved_ids():
+    medium = MediumClient('KEY')
+    requests = []
+    fake_batch(medium, requests)
+
+    assert medium.users_id(['a', 'b']) == [('a', 'id-a'), ('b', 'id-b')]
+    assert medium.users_id(['b', 'c', 'd', 'c']) == [('b', 'id-b'), ('c', 'id-c'), ('d', 'id-d'), ('c', 'id-c')]
+    assert len(requests) == 4
+
+
+def test_users_id_larger_than_the_cache():
+    medium = MediumClient('KEY')
+    requests = []
+    fake_batch(medium, requests)
+    names = [f'user-{i}' for i in range(5000)]
+
+    user_ids = medium.users_id(names, as_dict=True)
+
+    assert all(user_ids[name] == 'id-' + name for name in names)
+    assert len(requests) == 5000
+
+
+ARTICLE_INFO = {
+    'title': 'Title', 'subtitle': '', 'claps': 0, 'author': 'author_id', 'url': '',
+    'published_at': '2022-01-01 00:00:00', 'publication_id': '*Self-Published*',
+    'tags': [], 'topics': [], 'last_modified_at': '2022-01-01 00:00:00',
+    'reading_time': 1, 'word_count': 1, 'responses_count': 0, 'voters': 0,
+    'lang': 'en', 'image_url': '',
+}
+
+
+def fake_aget_resp(medium, requests, bad=()):
+    async def aget_resp(session, url, retries=0, schema=None):
+        requests.append(url)
+        article_id = url.split('/article/')[1].split('/')[0]
+        if article_id in bad:
+            return {'unexpected': True}, 200
+        if url.endswith('/content'):
+            return {'content': 'Text'}, 200
+        return ARTICLE_INFO, 200
+
+    medium._MediumClient__aget_resp = aget_resp
+
+
+def test_fetch_articles_loads_the_rest_when_one_fails():
+    medium = MediumClient('KEY')
+    fake_aget_resp(medium, [], bad={'bad'})
+    articles = [medium.article(article_id, save_info=False) for article_id in ['bad', '1', '2', '3']]
+
+    with pytest.raises(KeyError):
+        medium.fetch_articles(articles)
+
+    assert [article.title for article in articles] == [None, 'Title', 'Title', 'Title']
+
+
+def test_fetch_articles_skips_loaded_content():
+    medium = MediumClient('KEY')
+    requests = []
+    fake_aget_resp(medium, requests)
+    articles = [medium.article(article_id, save_info=False) for article_id in ['1', '2']]
+
+    medium.fetch_articles(articles, content=True)
+    medium.fetch_articles(articles, content=True)
+
+    assert len(requests) == 4
+    assert articles[0].content == 'Text'
+
+
+def test_fetch_articles_leaves_failed_calls_unloaded():
+    medium = MediumClient('KEY')
+    medium.remaining_calls = 0
+    articles = [medium.article('1', save_info=False)]
+
+    async def aget_resp(session, url, retries=0, schema=None):
+        return {}, None
+
+    medium._MediumClient__aget_resp = aget_resp
+    medium.fetch_articles(articles, content=True)
+
+    assert articles[0].title is None
+    assert not articles[0]._has_content()
+
+
+def quota_headers(remaining):
+    return {'X-RateLimit-All-endpoints-Limit': '100', 'X-RateLimit-All-endpoints-Remaining': str(remaining)}
+
+
+def test_reserve_and_release_track_calls_in_flight():
+    medium = MediumClient('KEY')
+    reserve = medium._MediumClient__reserve_call
+    release = medium._MediumClient__release_call
+    medium.remaining_calls = 2
+
+    assert reserve() and reserve()
+    assert not reserve()
+
+    release(quota_headers(1))
+    assert medium.remaining_calls == 1
+    assert not reserve()
+
+    release()
+    assert reserve()
+
+
+class FakeResponse:
+    def __init__(self, remaining):
+        self.status = 200
+        self.headers = quota_headers(remaining)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return b'"ok"'
+
+
+class FakeSession:
+    def __init__(self, remaining):
+        self.remaining = remaining
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+        return FakeResponse(self.remaining)
+
+
+def fake_session(medium, session):
+    class Context:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    medium._MediumClient__client_session = lambda limit=100: Context()
+
+
+def test_exhausted_quota_sends_one_probe_per_batch():
+    medium = MediumClient('KEY')
+    medium.remaining_calls = 0
+    session = FakeSession(remaining=0)
+    fake_session(medium, session)
+
+    results = medium.article_info(['a', 'b', 'c'])
+
+    assert [resp for _, resp in results].count({}) == 2
+    assert len(session.urls) == 1
+
+    medium.article_info(['a', 'b'])
+    assert len(session.urls) == 2
+
+
+def test_probe_refreshes_a_reset_quota():
+    medium = MediumClient('KEY')
+    medium.remaining_calls = 0
+    session = FakeSession(remaining=50)
+    fake_session(medium, session)
+
+    results = medium.article_info(['a', 'b', 'c'])
+
+    assert [resp for _, resp in results] == ['ok'] * 3
+    assert medium.remaining_calls == 50
+
+
+def test_sync_calls_share_the_quota_gate():
+    medium = MediumClient('KEY')
+    medium.remaining_calls = 0
+    requests = []
+
+    def request(endpoint):
+        requests.append(endpoint)
+        return b'{"error": "quota"}', 200, quota_headers(0)
+
+    medium._MediumClient__request = request
+
+    assert medium.article_info(['a']) == [('a', {})]
+    # The probe goes out, its retry is refused since the quota is still spent
+    assert len(requests) == 1
@@ -0,0 +1,33 @@
+from medium_api._ratelimit import RateLimiter
+
+
+def admitted_times(limiter, clock, until, step=0.01):
+    # Tries a call every `step` seconds, like a saturating client would
+    times = []
+    while clock.now < until:
+        while limiter.try_acquire() == 0.0:
+            times.append(clock.now)
+        clock.now = round(clock.now + step, 6)
+    return times
+
+
+def test_no_more_than_n_calls_in_any_window(clock):
+    clock.now = 9.99
+    limiter = RateLimiter(n=100, p=10, clock=clock)
+
+    times = admitted_times(limiter, clock, until=40)
+
+    assert len(times) > 100
+    for i, t in enumerate(times):
+        in_window = [u for u in times[:i + 1] if t - u < 10]
+        assert len(in_window) <= 100
+
+
+def test_burst_then_wait(clock):
+    limiter = RateLimiter(n=3, p=1, clock=clock)
+
+    assert [limiter.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.try_acquire() == 1.0
+
+    clock.now = 1.0
+    assert limiter.try_acquire() == 0.0